@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config import OKX_CACHE_DIR
+
+try:
+    # 選用相依：有安裝 orjson 時以其讀寫快取檔，與 okx_api 解析回應的方式一致
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+
+
+class FileCache:
+    """
+    以 JSON 檔保存的簡易 TTL 快取，每個 key 一個檔案：<root>/<namespace>/<key>.json
+    檔案內容為 {"ts": 寫入時間, "data": 原始資料}；同一行程內另有記憶體層，避免重複讀檔
+    """
+
+    def __init__(self, namespace: str, root: Optional[str] = None):
+        self.dir = Path(root or OKX_CACHE_DIR) / namespace
+        self._mem: Dict[str, Tuple[float, Any]] = {}
+
+    def _path(self, key: str) -> Path:
+        return self.dir / (key.replace("/", "_") + ".json")
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        if ttl <= 0:
+            return None
+        now = time.time()
+        hit = self._mem.get(key)
+        if hit is None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    envelope = _loads(f.read())
+                hit = (float(envelope["ts"]), envelope["data"])
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+            self._mem[key] = hit
+        ts, data = hit
+        if now - ts > ttl:
+            return None
+        return data
+
+    def set(self, key: str, data: Any) -> None:
+        ts = time.time()
+        self._mem[key] = (ts, data)
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            # 先寫暫存檔再替換，避免其他行程讀到寫一半的檔案
+            fd, tmp = tempfile.mkstemp(dir=self.dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps({"ts": ts, "data": data}))
+            os.replace(tmp, self._path(key))
+        except OSError:
+            # 快取寫入失敗不影響主流程
+            pass
+
+
+class TTLCache:
+    """
+    執行緒安全的記憶體 TTL 快取
+    同一 key 同時未命中時只由一個執行緒實際查詢，其餘執行緒共用該次查詢結果
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None and time.monotonic() - hit[0] <= self.ttl:
+                return hit[1]
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._inflight[key] = fut
+        if not owner:
+            return fut.result()
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            fut.set_exception(e)
+            raise
+        with self._lock:
+            if self.ttl > 0:
+                if key not in self._data and len(self._data) >= self.maxsize:
+                    # 超過上限時淘汰最早寫入的項目
+                    self._data.pop(next(iter(self._data)))
+                self._data[key] = (time.monotonic(), value)
+            self._inflight.pop(key, None)
+        fut.set_result(value)
+        return value
@@ -1,30 +1,18 @@
-import os
 import sys
-from typing import Any, Optional, Dict
+from typing import Any
 
-from items import read_item_file
-from okx_api import get_ticker
-
-
-def get_prices_for_items(inst_ids: Any) -> Dict[str, Optional[str]]:
-    results: Dict[str, Optional[str]] = {}
-    for inst_id in inst_ids:
-        try:
-            data = get_ticker(inst_id)
-            last = data.get("data", [{}])[0].get("last") if data.get("data") else None
-            results[inst_id] = last
-        except Exception:
-            results[inst_id] = None
-    return results
+from items import read_item_file, normalize_inst_ids
+from prices import iter_prices_for_items
+from config import ITEM_FILE
 
 
 def main_cli():
-    inst_ids: Any = read_item_file(os.path.join(os.path.dirname(__file__), "item.txt"))
+    inst_ids: Any = normalize_inst_ids(read_item_file(ITEM_FILE))
     if not inst_ids:
         print("未提供交易對，請在 item.txt 中填入，例如：BTC-USDT")
         sys.exit(1)
-    prices = get_prices_for_items(inst_ids)
-    for inst_id, last in prices.items():
+    # 結果一到即輸出，不必等待全部查詢完成
+    for inst_id, last in iter_prices_for_items(inst_ids):
         print(f"{inst_id}: {last if last is not None else 'N/A'}")
 
 
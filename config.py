@@ -1,15 +1,77 @@
 import os
-from dotenv import load_dotenv
+import types
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 專案根目錄與交易對清單檔
+BASE_DIR = Path(__file__).resolve().parent
+ITEM_FILE = BASE_DIR / "item.txt"
+_DOTENV_FILE = BASE_DIR / ".env"
+
+
+def _load_dotenv(path: Optional[Path] = None) -> None:
+    # .env 只需解析一次；已載入過（例如由父行程繼承環境）時跳過讀檔
+    if os.environ.get("OKX_DOTENV_LOADED"):
+        return
+    from dotenv import load_dotenv
+    load_dotenv(path)
+    os.environ["OKX_DOTENV_LOADED"] = "1"
+
+
+# 專案目錄有 .env 時於匯入時立即載入，讓 .env 中的調校參數（OKX_MAX_WORKERS 等）也能生效；
+# 沒有 .env 的公開行情 CLI 執行不匯入 dotenv
+if _DOTENV_FILE.is_file():
+    _load_dotenv(_DOTENV_FILE)
+
+# 一次擷取全部 OKX_* 環境變數（已含 .env）為唯讀快照，以下公開設定皆由此讀取
+_CFG = types.MappingProxyType({k: v for k, v in os.environ.items() if k.startswith("OKX_")})
 
-load_dotenv()
 # Base URL 可依需要切換（正式/模擬）。
 OKX_BASE_URL = "https://www.okx.com"
 
 # 金鑰（目前行情為公開端點不需用到，但保留以便擴充私有端點）
-OKX_API_KEY = os.getenv("OKX_API_KEY", "YOUR_API_KEY")
-OKX_SECRET_KEY = os.getenv("OKX_SECRET_KEY", "YOUR_SECRET_KEY")
-OKX_PASSPHRASE = os.getenv("OKX_PASSPHRASE", "YOUR_PASSPHRASE")
-USE_SIMULATED_TRADING = os.getenv("OKX_SIMULATED", "0") == "1"
+# OKX_API_KEY / OKX_SECRET_KEY / OKX_PASSPHRASE / USE_SIMULATED_TRADING 於首次讀取時才解析；
+# 專案目錄沒有 .env 時，只查公開行情的 CLI 執行完全不必載入 dotenv
+_PRIVATE_NAMES = ("OKX_API_KEY", "OKX_SECRET_KEY", "OKX_PASSPHRASE", "USE_SIMULATED_TRADING")
+_private: Optional[Dict[str, Any]] = None
+
+
+def _load_private() -> Dict[str, Any]:
+    global _private
+    if _private is None:
+        # 專案目錄沒有 .env 時，仍依 python-dotenv 預設規則往上層目錄尋找
+        _load_dotenv()
+        _private = {
+            "OKX_API_KEY": os.getenv("OKX_API_KEY", "YOUR_API_KEY"),
+            "OKX_SECRET_KEY": os.getenv("OKX_SECRET_KEY", "YOUR_SECRET_KEY"),
+            "OKX_PASSPHRASE": os.getenv("OKX_PASSPHRASE", "YOUR_PASSPHRASE"),
+            "USE_SIMULATED_TRADING": os.getenv("OKX_SIMULATED", "0") == "1",
+        }
+    return _private
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PRIVATE_NAMES:
+        return _load_private()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# 批次查詢行情時的最大併發數（避免觸發 OKX 頻率限制）
+OKX_MAX_WORKERS = int(_CFG.get("OKX_MAX_WORKERS", "8"))
+# 全行程同時送出的請求上限，以及遇到頻率限制（HTTP 429 / 50011）時的重試次數
+OKX_MAX_CONCURRENCY = int(_CFG.get("OKX_MAX_CONCURRENCY", "8"))
+OKX_MAX_RETRIES = int(_CFG.get("OKX_MAX_RETRIES", "3"))
+# HTTP 連線池大小（keep-alive 連線重用）
+OKX_POOL_CONNECTIONS = int(_CFG.get("OKX_POOL_CONNECTIONS", "16"))
+OKX_POOL_MAXSIZE = int(_CFG.get("OKX_POOL_MAXSIZE", "32"))
+# 本地快取目錄與行情快取秒數（0 表示停用）
+OKX_CACHE_DIR = _CFG.get("OKX_CACHE_DIR", str(BASE_DIR / ".cache"))
+OKX_TICKER_TTL_SECONDS = float(_CFG.get("OKX_TICKER_TTL_SECONDS", "5"))
+# K線快取秒數上限（實際取此值與一根K線長度的較小者）
+OKX_CANDLE_TTL_SECONDS = float(_CFG.get("OKX_CANDLE_TTL_SECONDS", "30"))
+# OKX 公開 WebSocket 端點；GUI 以 tickers 頻道即時更新價格，需安裝 websockets（見 requirements.txt）；OKX_WS_ENABLED=0 停用
+OKX_WS_PUBLIC_URL = _CFG.get("OKX_WS_PUBLIC_URL", "wss://ws.okx.com:8443/ws/v5/public")
+OKX_WS_ENABLED = _CFG.get("OKX_WS_ENABLED", "1") == "1"
 # GUI 自動刷新間隔（毫秒）
 GUI_REFRESH_INTERVAL_MS = 60_000
 
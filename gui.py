@@ -1,29 +1,33 @@
-import os
-import datetime
+import contextlib
+import json
+import time
+import numpy as np
 import pandas as pd
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.dates as mdates
-import mplfinance as mpf
-
-from items import read_item_file
-from okx_api import get_ticker, get_candlesticks, get_account_balance, get_account_bills, calc_spot_realized_pnl
-from config import GUI_REFRESH_INTERVAL_MS, TIMEZONE
-
-
-def get_prices_for_items(inst_ids: Any) -> Dict[str, Optional[str]]:
-    results: Dict[str, Optional[str]] = {}
-    for inst_id in inst_ids:
-        try:
-            data = get_ticker(inst_id)
-            last = data.get("data", [{}])[0].get("last") if data.get("data") else None
-            results[inst_id] = last
-        except Exception:
-            results[inst_id] = None
-    return results
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+try:
+    # WebSocket 即時行情需要 websockets（已列於 requirements.txt）；未安裝時退回僅使用 REST 輪詢
+    from websockets.sync.client import connect as ws_connect
+except ImportError:
+    ws_connect = None
+try:
+    # 選用相依：有安裝 orjson 時以其解析 WebSocket 推送，與 okx_api、cache 的作法一致
+    import orjson
+except ImportError:
+    orjson = None
+
+from items import read_item_file, normalize_inst_ids
+from prices import get_prices_for_items
+from okx_api import get_candlesticks, get_account_balance
+from config import GUI_REFRESH_INTERVAL_MS, TIMEZONE, ITEM_FILE, OKX_WS_PUBLIC_URL, OKX_WS_ENABLED
+
+# K線顏色（漲 / 跌）
+CANDLE_UP_COLOR = "#006340"
+CANDLE_DOWN_COLOR = "#a02128"
 
 
 def get_candlestick_data(inst_id: str, bar: str = "1m", limit: int = 100) -> Optional[pd.DataFrame]:
@@ -32,53 +36,256 @@ def get_candlestick_data(inst_id: str, bar: str = "1m", limit: int = 100) -> Opt
     """
     try:
         data = get_candlesticks(inst_id, bar, limit)
-        if not data.get("data"):
+        rows = data.get("data")
+        if not rows:
             return None
-        
-        # OKX K線數據格式: [timestamp, open, high, low, close, volume, ...]
-        df = pd.DataFrame(data["data"], columns=[
-            "timestamp", "open", "high", "low", "close", "volume", 
-            "volCcy", "volCcyQuote", "confirm"
-        ])
-        
-        # 轉換數據類型
-        # 將時間戳轉換為UTC時間，然後轉換為配置的時區
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-        # 轉換為配置的時區
-        df["timestamp"] = df["timestamp"].dt.tz_convert(TIMEZONE)
-        # 移除時區信息，保留本地時間
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
-        for col in ["open", "high", "low", "close", "volume"]:
-            df[col] = pd.to_numeric(df[col])
-        
-        # 設置時間戳為索引
-        df.set_index("timestamp", inplace=True)
-        
-        # 只保留OHLCV數據
-        df = df[["open", "high", "low", "close", "volume"]]
-        
-        return df
+
+        # OKX K線數據格式: [timestamp, open, high, low, close, volume, volCcy, volCcyQuote, confirm]
+        # 回傳為由新到舊，反轉為時間順序；只取前 6 欄，一次轉換型別，不建立用不到的欄位
+        arr = np.asarray(rows[::-1], dtype=object)
+        # 將時間戳轉換為UTC時間，再轉換為配置的時區，最後移除時區信息保留本地時間
+        ts = pd.to_datetime(arr[:, 0].astype(np.int64), unit="ms", utc=True).tz_convert(TIMEZONE).tz_localize(None)
+        ohlcv = arr[:, 1:6].astype(np.float64)
+        return pd.DataFrame(
+            ohlcv,
+            columns=["open", "high", "low", "close", "volume"],
+            index=pd.DatetimeIndex(ts, name="timestamp"),
+        )
     except Exception:
         return None
 
 
-class PriceWorker(QtCore.QThread):
+@contextlib.contextmanager
+def _batch_table_updates(table: QtWidgets.QTableWidget):
+    # 整批更新期間暫停重繪與訊號，結束後只重繪一次
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
+def _set_cell_text(table: QtWidgets.QTableWidget, row: int, col: int, text: str):
+    # 重用既有儲存格物件，只在尚未建立時才新增
+    item = table.item(row, col)
+    if item is None:
+        table.setItem(row, col, QtWidgets.QTableWidgetItem(text))
+    else:
+        item.setText(text)
+
+
+def _downsample_ohlc(df: pd.DataFrame, target_bars: int) -> pd.DataFrame:
+    """
+    將K線依序均分為 target_bars 組合併：open 取首筆、high 取最大、low 取最小、close 取末筆、volume 加總
+    每組以第一根K線的時間為索引
+    """
+    n = len(df)
+    if n <= target_bars:
+        return df
+    starts = np.arange(target_bars) * n // target_bars
+    ends = np.append(starts[1:], n) - 1
+    return pd.DataFrame(
+        {
+            "open": df["open"].to_numpy()[starts],
+            "high": np.maximum.reduceat(df["high"].to_numpy(), starts),
+            "low": np.minimum.reduceat(df["low"].to_numpy(), starts),
+            "close": df["close"].to_numpy()[ends],
+            "volume": np.add.reduceat(df["volume"].to_numpy(), starts),
+        },
+        index=df.index[starts],
+    )
+
+
+def safe_num(val: Any) -> str:
+    # 固定 8 位小數後去除尾端的 0 與小數點；無法解析或近似 0 時顯示 "0"
+    try:
+        fval = float(val)
+    except Exception:
+        return "0"
+    if abs(fval) < 1e-9:
+        return "0"
+    return f"{fval:.8f}".rstrip("0").rstrip(".")
+
+
+class PriceHistory:
+    """
+    固定容量的價格歷史（環形緩衝區，SoA 配置）
+    t: 取得時間（epoch 奈秒，int64）；v: 價格（float64）；寫入位置為 count % capacity
+    """
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self.t = np.empty(capacity, dtype=np.int64)
+        self.v = np.empty(capacity, dtype=np.float64)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, t_ns: int, value: float):
+        i = self.count % self.capacity
+        self.t[i] = t_ns
+        self.v[i] = value
+        self.count += 1
+
+    def _start(self) -> int:
+        # 最早一筆資料的位置（緩衝區未滿時為 0）
+        return 0 if self.count <= self.capacity else self.count % self.capacity
+
+    def latest(self) -> float:
+        return self.v[(self.count - 1) % self.capacity]
+
+    def latest_time(self) -> int:
+        return int(self.t[(self.count - 1) % self.capacity])
+
+    def value_at_or_before(self, t_ns: int) -> float:
+        """
+        回傳不晚於 t_ns 的最後一筆價格；若全部晚於 t_ns，回傳最早一筆
+        緩衝區為旋轉後的有序陣列，分成兩段各自二分搜尋，不需重排或複製
+        """
+        start = self._start()
+        if start:
+            wrapped = self.t[:start]
+            if t_ns >= wrapped[0]:
+                return self.v[np.searchsorted(wrapped, t_ns, side="right") - 1]
+            head = self.t[start:]
+        else:
+            head = self.t[:len(self)]
+        idx = np.searchsorted(head, t_ns, side="right") - 1
+        return self.v[start + max(idx, 0)]
+
+
+class PriceWorker(QtCore.QObject):
+    """
+    長駐於專用 QThread 的價格查詢物件；每次刷新透過 queued 訊號呼叫 fetch，不再重建執行緒
+    """
     finished = QtCore.pyqtSignal(dict)
     failed = QtCore.pyqtSignal(str)
 
+    @QtCore.pyqtSlot(list)
+    def fetch(self, inst_ids: list):
+        try:
+            # 定時刷新一律走批次端點：每個週期固定一次請求，與交易對數量無關
+            results = get_prices_for_items(inst_ids, bulk=True)
+            self.finished.emit(results)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class TickerStreamWorker(QtCore.QThread):
+    """
+    訂閱 OKX 公開 WebSocket tickers 頻道，將各交易對最新價每秒彙整一次送回 GUI
+    連線中斷時以指數退避自動重連；需安裝 websockets
+    """
+    ticks = QtCore.pyqtSignal(dict)
+
+    # 彙整送出間隔；OKX 30 秒內沒有任何訊息會斷線，閒置時需主動送出 ping
+    _FLUSH_SECONDS = 1.0
+    _PING_SECONDS = 20.0
+
     def __init__(self, inst_ids: Any):
         super().__init__()
-        self.inst_ids = inst_ids
+        self.inst_ids = list(inst_ids)
+        self._ws = None
+        # 本次連線是否已收到推送資料；用於判斷斷線後是否重設退避
+        self._receivedData = False
+
+    def stop(self):
+        self.requestInterruption()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
 
     def run(self):
+        attempt = 0
+        while not self.isInterruptionRequested():
+            self._receivedData = False
+            try:
+                self._stream()
+            except Exception:
+                pass
+            # 連線曾正常收到資料即視為一般斷線，從頭計算退避；連不上或訂閱失敗才逐次加倍
+            attempt = 0 if self._receivedData else attempt + 1
+            # 重連前等待（1, 2, 4 ... 最多 60 秒），期間仍可被中止
+            deadline = time.monotonic() + min(60, 2 ** attempt)
+            while time.monotonic() < deadline and not self.isInterruptionRequested():
+                self.msleep(100)
+
+    def _stream(self):
+        with ws_connect(OKX_WS_PUBLIC_URL, open_timeout=10) as ws:
+            self._ws = ws
+            pending: Dict[str, str] = {}
+            try:
+                args = [{"channel": "tickers", "instId": inst} for inst in self.inst_ids]
+                ws.send(json.dumps({"op": "subscribe", "args": args}))
+                last_flush = last_recv = time.monotonic()
+                while not self.isInterruptionRequested():
+                    try:
+                        raw = ws.recv(timeout=self._FLUSH_SECONDS)
+                    except TimeoutError:
+                        raw = None
+                    now = time.monotonic()
+                    if raw is not None:
+                        last_recv = now
+                        if raw != "pong" and self._collect(raw, pending):
+                            self._receivedData = True
+                    elif now - last_recv >= self._PING_SECONDS:
+                        ws.send("ping")
+                        last_recv = now
+                    if pending and now - last_flush >= self._FLUSH_SECONDS:
+                        self.ticks.emit(pending)
+                        pending = {}
+                        last_flush = now
+            finally:
+                self._ws = None
+                # 斷線時送出尚未彙整送出的最新價，避免遺失最後一秒內的推送
+                if pending:
+                    self.ticks.emit(pending)
+
+    @staticmethod
+    def _collect(raw: str, pending: Dict[str, str]) -> bool:
+        # 推送格式：{"arg": {...}, "data": [{"instId": ..., "last": ...}]}；訂閱回覆等事件訊息沒有 data
+        # 回傳此訊息是否帶有行情資料
         try:
-            results = get_prices_for_items(self.inst_ids)
-            self.finished.emit(results)
-        except Exception as e:
-            self.failed.emit(str(e))
+            msg = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
+            return False
+        found = False
+        for row in msg.get("data") or []:
+            inst, last = row.get("instId"), row.get("last")
+            if inst and last:
+                pending[inst] = last
+                found = True
+        return found
+
+
+class CandleWorker(QtCore.QThread):
+    finished = QtCore.pyqtSignal(str, str, object)
+
+    def __init__(self, inst_id: str, bar: str, limit: int = 100):
+        super().__init__()
+        self.inst_id = inst_id
+        self.bar = bar
+        self.limit = limit
+
+    def run(self):
+        df = get_candlestick_data(self.inst_id, self.bar, self.limit)
+        # 已被新的請求取代時不再回傳結果
+        if not self.isInterruptionRequested():
+            self.finished.emit(self.inst_id, self.bar, df)
 
 
 class PriceWindow(QtWidgets.QMainWindow):
+    # 同一標的提醒冷卻時間（10 分鐘，monotonic 奈秒）
+    _COOLDOWN_NS = 10 * 60 * 1_000_000_000
+    # 送往價格查詢執行緒的請求（跨執行緒自動以 queued 方式傳遞）
+    pricesRequested = QtCore.pyqtSignal(list)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("OKX Market Data")
@@ -105,7 +312,17 @@ class PriceWindow(QtWidgets.QMainWindow):
         # 圖表區
         self.figure = Figure(figsize=(6, 4))
         self.canvas = FigureCanvas(self.figure)
-        # 初始化時不創建ax，在draw_plot中動態創建
+        self._init_chart_axes()
+        # 上次繪圖的 (標的, 週期, 最新K線) 鍵值；未變動時跳過重繪
+        self._last_plot_key: Optional[tuple] = None
+        # K線查詢執行緒：最新一個，以及仍在執行中的（保留參照直到結束）
+        self._candleWorker: Optional[CandleWorker] = None
+        self._candleWorkers: list = []
+        # 繪圖防抖：連續觸發（例如捲動下拉選單）時，只在停止 150 ms 後實際繪製一次
+        self._drawTimer = QtCore.QTimer(self)
+        self._drawTimer.setSingleShot(True)
+        self._drawTimer.setInterval(150)
+        self._drawTimer.timeout.connect(self._real_draw_plot)
 
         # 圖表標的一覽
         self.symbolLabel = QtWidgets.QLabel("Symbol:")
@@ -186,23 +403,48 @@ class PriceWindow(QtWidgets.QMainWindow):
         rootLayout.addWidget(self.tabs)
         central.setLayout(rootLayout)
 
-        self.inst_ids = read_item_file(os.path.join(os.path.dirname(__file__), "item.txt"))
+        self.inst_ids = normalize_inst_ids(read_item_file(ITEM_FILE))
         self._populate_table()
         self._init_plot_state()
-        # 提醒冷卻追蹤（避免連續彈窗）：{inst: datetime}
-        self._lastAlertAt: Dict[str, datetime.datetime] = {}
-        self._alertCooldownMinutes = 10
+        # 提醒冷卻追蹤（避免連續彈窗）：{inst: time.monotonic_ns()}
+        self._lastAlertAt: Dict[str, int] = {}
+        # 漲幅欄背景色只建立一次，避免每列重新配置 Qt 物件
+        self._brush_red = QtGui.QBrush(QtGui.QColor(220, 20, 60))
+        self._brush_green = QtGui.QBrush(QtGui.QColor(0, 128, 0))
+        self._brush_default = QtGui.QBrush()
+
+        # 價格查詢執行緒只建立一次，整個視窗生命週期重複使用
+        self._priceThread = QtCore.QThread(self)
+        self.worker = PriceWorker()
+        self.worker.moveToThread(self._priceThread)
+        self.pricesRequested.connect(self.worker.fetch)
+        self.worker.finished.connect(self.on_results)
+        self.worker.failed.connect(self.on_failed)
+        self._priceThread.start()
+        # 查詢進行中時忽略新的刷新請求（手動連點或計時器觸發）
+        self._inFlight = False
+
+        # WebSocket 即時行情：各交易對有推送期間不再走 REST 定時輪詢，未推送者（斷線、訂閱失敗、久未成交）仍由 REST 補上
+        # {inst: 最近一次收到推送的 time.monotonic_ns()}
+        self._streamLastNs: Dict[str, int] = {}
+        self._stream: Optional[TickerStreamWorker] = None
+        if ws_connect is not None and OKX_WS_ENABLED and self.inst_ids:
+            self._stream = TickerStreamWorker(self.inst_ids)
+            self._stream.ticks.connect(self.on_stream_ticks)
+            self._stream.start()
 
         self.refreshBtn.clicked.connect(self.refresh)
         self.symbolSelect.currentIndexChanged.connect(self.draw_plot)
         self.periodSelect.currentIndexChanged.connect(self.draw_plot)
         self.assetsRefreshBtn.clicked.connect(self.refresh_assets)
 
-        # 每分鐘自動刷新
+        # 每分鐘自動刷新行情與K線圖：對齊牆鐘整分（+500ms），讓每次刷新都落在K線收盤之後
+        # 需使用 PreciseTimer：預設的 CoarseTimer 在 20 秒以上會降為整秒精度，可能在整分之前觸發
         self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(GUI_REFRESH_INTERVAL_MS)
-        self.timer.timeout.connect(self.refresh)
-        self.timer.start()
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._aligned_tick)
+        self._schedule_aligned_refresh()
 
         # 每 30 分鐘更新一次漲幅欄（即使沒有新價格也重算）
         self.changeTimer = QtCore.QTimer(self)
@@ -214,54 +456,146 @@ class PriceWindow(QtWidgets.QMainWindow):
         QtCore.QTimer.singleShot(0, self.refresh)
         QtCore.QTimer.singleShot(0, self.refresh_assets)
 
+    def closeEvent(self, event):
+        # 結束價格查詢執行緒的事件迴圈，等待進行中的查詢完成後再關閉視窗
+        self._priceThread.quit()
+        self._priceThread.wait()
+        if self._stream is not None:
+            # 串流執行緒沒有需要收尾的狀態；連線建立中（最長 open_timeout）無法中斷，只短暫等待，不讓關閉視窗卡住
+            self._stream.stop()
+            self._stream.wait(1000)
+        super().closeEvent(event)
+
+    def _schedule_aligned_refresh(self):
+        # 距離下一個刷新邊界的毫秒數；每次重新計算，避免固定間隔累積漂移
+        interval = GUI_REFRESH_INTERVAL_MS
+        ms_to_next = interval - (time.time_ns() // 1_000_000) % interval + 500
+        self.timer.start(ms_to_next)
+
+    def _aligned_tick(self):
+        stale = self._stream_stale_ids()
+        if stale:
+            self._request_prices(stale)
+        # K線圖同樣在整分後重抓，取得剛收盤的K線
+        self.draw_plot()
+        self._schedule_aligned_refresh()
+
+    def _stream_stale_ids(self) -> List[str]:
+        # 最近一個刷新週期內沒有收到 WebSocket 推送的交易對；未啟用串流時即為全部交易對
+        cutoff = time.monotonic_ns() - GUI_REFRESH_INTERVAL_MS * 1_000_000
+        last_seen = self._streamLastNs
+        return [inst for inst in self.inst_ids if last_seen.get(inst, cutoff) <= cutoff]
+
+    def _init_chart_axes(self):
+        # 價格與成交量座標軸只建立一次並固定位置；重繪時只替換K線圖元，不重算版面
+        self.priceAx = self.figure.add_axes([0.12, 0.40, 0.84, 0.50])
+        self.volumeAx = self.figure.add_axes([0.12, 0.12, 0.84, 0.24], sharex=self.priceAx)
+        self.priceAx.set_ylabel("Price (USDT)")
+        self.volumeAx.set_ylabel("Volume")
+        self.priceAx.tick_params(labelbottom=False)
+        for ax in (self.priceAx, self.volumeAx):
+            ax.grid(True, linestyle=":", linewidth=0.5)
+        # X 軸以K線序號定位（不含休市空檔），刻度文字由序號對應回時間
+        self.volumeAx.xaxis.set_major_locator(MaxNLocator(nbins=6, integer=True))
+        self.volumeAx.xaxis.set_major_formatter(FuncFormatter(self._format_chart_time))
+        self._chartTimes: Optional[pd.DatetimeIndex] = None
+        self._chartTimeFormat = "%H:%M"
+        self._chartArtists: list = []
+
+    def _format_chart_time(self, x: float, pos: Optional[int] = None) -> str:
+        i = int(round(x))
+        if self._chartTimes is None or not 0 <= i < len(self._chartTimes):
+            return ""
+        return self._chartTimes[i].strftime(self._chartTimeFormat)
+
     def _populate_table(self):
         self.table.setRowCount(len(self.inst_ids))
         for row, inst in enumerate(self.inst_ids):
             self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(inst))
             self.table.setItem(row, 1, QtWidgets.QTableWidgetItem("-"))
             self.table.setItem(row, 2, QtWidgets.QTableWidgetItem("-"))
+        # 漲幅欄上次寫入的 (文字, 背景)；內容未變的列不再觸碰儲存格
+        self._lastChange: Dict[str, Tuple[str, QtGui.QBrush]] = {}
 
     def _init_plot_state(self):
-        # 歷史緩存: {inst_id: list[tuple[datetime, float]]} - 保留用於漲幅計算
-        self.histories: Dict[str, list] = {inst: [] for inst in self.inst_ids}
-        self.symbolSelect.clear()
-        self.symbolSelect.addItems(self.inst_ids)
+        # 歷史緩存: {inst_id: PriceHistory} - 保留用於漲幅計算
+        self.histories: Dict[str, PriceHistory] = {inst: PriceHistory() for inst in self.inst_ids}
+        # 重建選單期間暫停訊號，避免 clear()/addItems 逐次觸發重繪；完成後只排程一次
+        self.symbolSelect.blockSignals(True)
+        try:
+            self.symbolSelect.clear()
+            self.symbolSelect.addItems(self.inst_ids)
+        finally:
+            self.symbolSelect.blockSignals(False)
         self.draw_plot()
 
     def refresh(self):
         if not self.inst_ids:
             self.statusLabel.setText("No trading pairs in item.txt")
             return
+        self._request_prices(self.inst_ids)
+
+    def _request_prices(self, inst_ids: List[str]):
+        if self._inFlight:
+            return
+        self._inFlight = True
         self.refreshBtn.setEnabled(False)
         self.statusLabel.setText("Querying...")
-        self.worker = PriceWorker(self.inst_ids)
-        self.worker.finished.connect(self.on_results)
-        self.worker.failed.connect(self.on_failed)
-        self.worker.start()
+        self.pricesRequested.emit(list(inst_ids))
 
     def on_results(self, results: Dict[str, Optional[str]]):
-        for row, inst in enumerate(self.inst_ids):
-            price = results.get(inst)
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(price if price is not None else "N/A"))
-            # 更新歷史
-            try:
-                if price is not None:
-                    now = datetime.datetime.now()
-                    self.histories.setdefault(inst, []).append((now, float(price)))
-                    if len(self.histories[inst]) > 200:
-                        self.histories[inst] = self.histories[inst][-200:]
-            except Exception:
-                pass
+        self._inFlight = False
+        now_ns = time.time_ns()
+        with _batch_table_updates(self.table):
+            for row, inst in enumerate(self.inst_ids):
+                # 只查詢部分交易對時（其餘由 WebSocket 更新），不覆寫未查詢的儲存格
+                if inst not in results:
+                    continue
+                price = results.get(inst)
+                _set_cell_text(self.table, row, 1, price if price is not None else "N/A")
+                # 更新歷史
+                try:
+                    if price is not None:
+                        self.histories[inst].append(now_ns, float(price))
+                except Exception:
+                    pass
         self.statusLabel.setText("Complete")
         self.refreshBtn.setEnabled(True)
         self.update_change_column()
-        self.draw_plot()
+
+    def on_stream_ticks(self, ticks: Dict[str, str]):
+        seen_ns = time.monotonic_ns()
+        for inst in ticks:
+            self._streamLastNs[inst] = seen_ns
+        now_ns = time.time_ns()
+        # 歷史只依刷新間隔取樣，維持與 REST 輪詢相同的時間密度（200 筆涵蓋的時間長度不變）
+        sample_ns = GUI_REFRESH_INTERVAL_MS * 1_000_000
+        sampled = False
+        with _batch_table_updates(self.table):
+            for row, inst in enumerate(self.inst_ids):
+                price = ticks.get(inst)
+                if price is None:
+                    continue
+                _set_cell_text(self.table, row, 1, price)
+                try:
+                    series = self.histories[inst]
+                    if not len(series) or now_ns - series.latest_time() >= sample_ns:
+                        series.append(now_ns, float(price))
+                        sampled = True
+                except Exception:
+                    pass
+        if sampled:
+            self.update_change_column()
 
     def on_failed(self, err: str):
+        self._inFlight = False
         self.statusLabel.setText(f"Error: {err}")
         self.refreshBtn.setEnabled(True)
 
     def draw_plot(self):
+        self._drawTimer.start()
+
+    def _real_draw_plot(self):
         if not self.inst_ids:
             return
         symbol = self.symbolSelect.currentText() if self.symbolSelect.count() else None
@@ -269,106 +603,114 @@ class PriceWindow(QtWidgets.QMainWindow):
             return
         
         period = self.periodSelect.currentText()
-        
-        # 清除當前圖形
-        self.figure.clear()
-        
-        # 獲取K線數據
-        df = get_candlestick_data(symbol, period, 100)
-        
+
+        # 在背景執行緒獲取K線數據，避免 REST 請求卡住介面；取消尚未完成的前一次請求
+        if self._candleWorker is not None:
+            self._candleWorker.requestInterruption()
+        self._candleWorkers = [w for w in self._candleWorkers if w.isRunning()]
+        worker = CandleWorker(symbol, period, 100)
+        worker.finished.connect(self._render_plot)
+        self._candleWorker = worker
+        self._candleWorkers.append(worker)
+        worker.start()
+
+    def _render_plot(self, symbol: str, period: str, df: Optional[pd.DataFrame]):
+        # 使用者已切換到其他標的或週期時，捨棄過時的結果
+        if symbol != self.symbolSelect.currentText() or period != self.periodSelect.currentText():
+            return
+
+        # 標的、週期與最新一根K線皆未變動時，圖面相同，不必重繪
+        key = (symbol, period, df.index[-1], tuple(df.iloc[-1])) if df is not None and not df.empty else (symbol, period, None)
+        if key == self._last_plot_key:
+            return
+        self._last_plot_key = key
+
+        # K線數遠多於畫面可容納（約 6 px 一根）時先合併，減少送進 Agg 的圖元數
+        target_bars = max(50, self.canvas.width() // 6)
+        if df is not None and len(df) > 2 * target_bars:
+            df = _downsample_ohlc(df, target_bars)
+
+        # 移除上一次的K線圖元（座標軸本身保留）
+        for artist in self._chartArtists:
+            artist.remove()
+        self._chartArtists = []
+
         if df is not None and not df.empty:
-            try:
-                mpf.plot(df, type='candle', style='charles', 
-                        title=f"{symbol} - {period} Candlestick Chart ({TIMEZONE})",
-                        ylabel="Price (USDT)",
-                        volume=True,
-                        figsize=(6, 4),
-                        fig=self.figure,
-                        datetime_format='%H:%M',
-                        tight_layout=True)
-            except Exception as e:
-                ax = self.figure.add_subplot(111)
-                ax.grid(True, linestyle=":", linewidth=0.5)
-                ax.set_xlabel("Time")
-                ax.set_ylabel("Price")
-                ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-                if 'close' in df.columns:
-                    ax.plot(df.index, df['close'], linewidth=1.2, color='blue')
-                    ax.set_title(f"{symbol} - {period} (Close Price)")
-                else:
-                    ax.set_title(f"{symbol} - {period} No Data")
-                self.figure.tight_layout(pad=2.0)
+            x = np.arange(len(df))
+            o, h, l, c, v = (df[col].to_numpy() for col in ("open", "high", "low", "close", "volume"))
+            colors = np.where(c >= o, CANDLE_UP_COLOR, CANDLE_DOWN_COLOR)
+            self._chartArtists.append(self.priceAx.vlines(x, l, h, colors=colors, linewidth=0.8))
+            self._chartArtists.append(self.priceAx.bar(x, np.abs(c - o), bottom=np.minimum(o, c), width=0.6, color=colors))
+            self._chartArtists.append(self.volumeAx.bar(x, v, width=0.6, color=colors, alpha=0.6))
+            self._chartTimes = df.index
+            self._chartTimeFormat = "%m-%d" if period.endswith(("D", "W", "M")) else "%H:%M"
+            pad = (h.max() - l.min()) * 0.05 or abs(h.max()) * 0.01 or 1.0
+            self.priceAx.set_xlim(-0.5, len(df) - 0.5)
+            self.priceAx.set_ylim(l.min() - pad, h.max() + pad)
+            self.volumeAx.set_ylim(0, v.max() * 1.1 or 1.0)
+            self.priceAx.set_title(f"{symbol} - {period} Candlestick Chart ({TIMEZONE})")
         else:
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, f"{symbol} - {period}\nNo K-line Data", 
-                   ha='center', va='center', transform=ax.transAxes, fontsize=12)
-            ax.set_title(f"{symbol} - {period} No Data")
-        self.figure.tight_layout(pad=3.0)
-        self.figure.subplots_adjust(bottom=0.15)
-        self.figure.autofmt_xdate()
+            self._chartTimes = None
+            self._chartArtists.append(self.priceAx.text(
+                0.5, 0.5, f"{symbol} - {period}\nNo K-line Data",
+                ha='center', va='center', transform=self.priceAx.transAxes, fontsize=12))
+            self.priceAx.set_title(f"{symbol} - {period} No Data")
         self.canvas.draw_idle()
 
     def update_change_column(self):
         # 針對每個標的，計算相對 30 分鐘前的漲幅百分比
         if not self.inst_ids:
             return
-        now = datetime.datetime.now()
-        threshold = now - datetime.timedelta(minutes=30)
-        for row, inst in enumerate(self.inst_ids):
-            series = self.histories.get(inst, [])
-            if not series or len(series) < 2:
-                self.table.setItem(row, 2, QtWidgets.QTableWidgetItem("N/A"))
-                continue
-            # 取得當前價
-            _, current_val = series[-1]
-            # 尋找最接近且不晚於 threshold 的舊資料
-            baseline_val = None
-            last_before_or_at = None
-            for t, v in series:
-                if t <= threshold:
-                    last_before_or_at = v
-                else:
-                    break
-            if last_before_or_at is not None:
-                baseline_val = last_before_or_at
-            else:
-                # 若沒有早於閾值的資料，則以最早一筆作為基準（資料不足 30 分鐘）
-                baseline_val = series[0][1]
-            try:
-                pct = None
-                if baseline_val and baseline_val > 0:
-                    pct = (current_val - baseline_val) / baseline_val * 100.0
-                    text = f"{pct:+.2f}%"
+        threshold_ns = time.time_ns() - 30 * 60 * 1_000_000_000
+        abs_threshold = self.alertThreshold.value()
+        # 彈窗提醒延後到表格批次更新結束後，避免模態對話框出現時表格仍暫停重繪
+        alerts = []
+        with _batch_table_updates(self.table):
+            for row, inst in enumerate(self.inst_ids):
+                series = self.histories.get(inst)
+                if series is None or len(series) < 2:
+                    # 資料不足兩筆時顯示 N/A；同樣重用既有儲存格
+                    text, pct = "N/A", None
                 else:
-                    text = "N/A"
-            except Exception:
-                text = "N/A"
-                pct = None
-            item = self.table.item(row, 2)
-            if item is None:
-                item = QtWidgets.QTableWidgetItem()
-                self.table.setItem(row, 2, item)
-            item.setText(text)
-            # 顏色標示與提醒
-            default_bg = QtGui.QBrush()
-            if pct is None:
-                item.setBackground(default_bg)
-                continue
-            abs_threshold = self.alertThreshold.value()
-            triggered = abs(pct) >= abs_threshold
-            if triggered:
-                color = QtGui.QColor(220, 20, 60) if pct < 0 else QtGui.QColor(0, 128, 0)
-                item.setBackground(QtGui.QBrush(color).color())
-                self._maybe_alert(inst, pct)
-            else:
-                item.setBackground(default_bg)
+                    # 取得當前價
+                    current_val = series.latest()
+                    # 尋找最接近且不晚於 threshold 的舊資料（二分搜尋）；
+                    # 若沒有早於閾值的資料，則以最早一筆作為基準（資料不足 30 分鐘）
+                    baseline_val = series.value_at_or_before(threshold_ns)
+                    try:
+                        pct = None
+                        if baseline_val and baseline_val > 0:
+                            pct = (current_val - baseline_val) / baseline_val * 100.0
+                            text = f"{pct:+.2f}%"
+                        else:
+                            text = "N/A"
+                    except Exception:
+                        text = "N/A"
+                        pct = None
+                # 顏色標示與提醒
+                brush = self._brush_default
+                if pct is not None and abs(pct) >= abs_threshold:
+                    brush = self._brush_red if pct < 0 else self._brush_green
+                    alerts.append((inst, pct))
+                last = self._lastChange.get(inst)
+                item = self.table.item(row, 2)
+                if last is not None and last[0] == text and last[1] is brush and item is not None:
+                    continue
+                if item is None:
+                    item = QtWidgets.QTableWidgetItem()
+                    self.table.setItem(row, 2, item)
+                item.setText(text)
+                item.setBackground(brush)
+                self._lastChange[inst] = (text, brush)
+        for inst, pct in alerts:
+            self._maybe_alert(inst, pct)
 
     def _maybe_alert(self, inst: str, pct: float):
         if not self.alertEnable.isChecked():
             return
-        now = datetime.datetime.now()
+        now = time.monotonic_ns()
         last_at = self._lastAlertAt.get(inst)
-        if last_at and (now - last_at) < datetime.timedelta(minutes=self._alertCooldownMinutes):
+        if last_at is not None and now - last_at < self._COOLDOWN_NS:
             return
         self._lastAlertAt[inst] = now
         try:
@@ -389,14 +731,6 @@ class PriceWindow(QtWidgets.QMainWindow):
         self.accWorker.start()
 
     def on_assets(self, payload: Dict[str, dict]):
-        def safe_num(val):
-            try:
-                fval = float(val)
-                if abs(fval) < 1e-9:
-                    return "0"
-                return f"{fval:.8f}".rstrip('0').rstrip('.') if '.' in f"{fval:.8f}" else f"{fval:.8f}"
-            except Exception:
-                return "0"
         try:
             bal = payload.get("balance", {})
             # 刪除分幣損益處理，不再 show bills/realizedMap
@@ -405,16 +739,17 @@ class PriceWindow(QtWidgets.QMainWindow):
                 totalEq = safe_num(d0.get("totalEq", 0))
                 details = d0.get("details") or []
                 self.assetsSummary.setText(f"Total Equity: {totalEq}")
-                self.assetsTable.setRowCount(len(details))
-                for r, d in enumerate(details):
-                    ccy = d.get("ccy", "")
-                    eq = safe_num(d.get("eq"))
-                    avail = safe_num(d.get("availEq"))
-                    upl = safe_num(d.get("upl"))
-                    self.assetsTable.setItem(r, 0, QtWidgets.QTableWidgetItem(ccy))
-                    self.assetsTable.setItem(r, 1, QtWidgets.QTableWidgetItem(eq))
-                    self.assetsTable.setItem(r, 2, QtWidgets.QTableWidgetItem(avail))
-                    self.assetsTable.setItem(r, 3, QtWidgets.QTableWidgetItem(upl))
+                with _batch_table_updates(self.assetsTable):
+                    self.assetsTable.setRowCount(len(details))
+                    for r, d in enumerate(details):
+                        ccy = d.get("ccy", "")
+                        eq = safe_num(d.get("eq"))
+                        avail = safe_num(d.get("availEq"))
+                        upl = safe_num(d.get("upl"))
+                        _set_cell_text(self.assetsTable, r, 0, ccy)
+                        _set_cell_text(self.assetsTable, r, 1, eq)
+                        _set_cell_text(self.assetsTable, r, 2, avail)
+                        _set_cell_text(self.assetsTable, r, 3, upl)
             else:
                 self.assetsSummary.setText("Total Equity: N/A")
                 self.assetsTable.setRowCount(0)
@@ -428,335 +763,16 @@ class PriceWindow(QtWidgets.QMainWindow):
         self.assetsStatus.setText("Error")
         self.assetsRefreshBtn.setEnabled(True)
 
-    # ===== 資產：查詢執行緒 =====
+
+# ===== 資產：查詢執行緒 =====
 class AccountsWorker(QtCore.QThread):
     finished = QtCore.pyqtSignal(dict)
     failed = QtCore.pyqtSignal(str)
 
     def run(self):
         try:
+            # 資產頁只顯示餘額，不再查詢帳戶流水（bills）
             bal = get_account_balance()
-            bills = get_account_bills(limit=100)
-            self.finished.emit({"balance": bal, "bills": bills})
+            self.finished.emit({"balance": bal})
         except Exception as e:
             self.failed.emit(str(e))
-
-    def draw_plot(self):
-        if not self.inst_ids:
-            return
-        symbol = self.symbolSelect.currentText() if self.symbolSelect.count() else None
-        if not symbol:
-            return
-        
-        period = self.periodSelect.currentText()
-        
-        # 清除當前圖形
-        self.figure.clear()
-        
-        # 獲取K線數據
-        df = get_candlestick_data(symbol, period, 100)
-        
-        if df is not None and not df.empty:
-            # 使用mplfinance繪製K線圖
-            try:
-                # 使用mplfinance繪製K線圖到當前figure
-                mpf.plot(df, type='candle', style='charles', 
-                        title=f"{symbol} - {period} Candlestick Chart ({TIMEZONE})",
-                        ylabel="Price (USDT)",
-                        volume=True,
-                        figsize=(6, 4),
-                        fig=self.figure,
-                        datetime_format='%H:%M',
-                        tight_layout=True)
-                
-            except Exception as e:
-                # 如果mplfinance失敗，回退到簡單折線圖
-                ax = self.figure.add_subplot(111)
-                ax.grid(True, linestyle=":", linewidth=0.5)
-                ax.set_xlabel("Time")
-                ax.set_ylabel("Price")
-                ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-                
-                if 'close' in df.columns:
-                    ax.plot(df.index, df['close'], linewidth=1.2, color='blue')
-                    ax.set_title(f"{symbol} - {period} (Close Price)")
-                else:
-                    ax.set_title(f"{symbol} - {period} No Data")
-                
-                # 為折線圖也添加布局調整
-                self.figure.tight_layout(pad=2.0)
-        else:
-            # 沒有數據時顯示提示
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, f"{symbol} - {period}\nNo K-line Data", 
-                   ha='center', va='center', transform=ax.transAxes, fontsize=12)
-            ax.set_title(f"{symbol} - {period} No Data")
-        
-        # 調整圖形布局，確保x軸標題不被覆蓋
-        self.figure.tight_layout(pad=3.0)
-        self.figure.subplots_adjust(bottom=0.15)  # 為x軸標題留出更多空間
-        self.figure.autofmt_xdate()
-        self.canvas.draw_idle()
-
-    def update_change_column(self):
-        # 針對每個標的，計算相對 30 分鐘前的漲幅百分比
-        if not self.inst_ids:
-            return
-        now = datetime.datetime.now()
-        threshold = now - datetime.timedelta(minutes=30)
-        for row, inst in enumerate(self.inst_ids):
-            series = self.histories.get(inst, [])
-            if not series or len(series) < 2:
-                self.table.setItem(row, 2, QtWidgets.QTableWidgetItem("N/A"))
-                continue
-            # 取得當前價
-            _, current_val = series[-1]
-            # 尋找最接近且不晚於 threshold 的舊資料
-            baseline_val = None
-            last_before_or_at = None
-            for t, v in series:
-                if t <= threshold:
-                    last_before_or_at = v
-                else:
-                    break
-            if last_before_or_at is not None:
-                baseline_val = last_before_or_at
-            else:
-                # 若沒有早於閾值的資料，則以最早一筆作為基準（資料不足 30 分鐘）
-                baseline_val = series[0][1]
-            try:
-                pct = None
-                if baseline_val and baseline_val > 0:
-                    pct = (current_val - baseline_val) / baseline_val * 100.0
-                    text = f"{pct:+.2f}%"
-                else:
-                    text = "N/A"
-            except Exception:
-                text = "N/A"
-                pct = None
-            item = self.table.item(row, 2)
-            if item is None:
-                item = QtWidgets.QTableWidgetItem()
-                self.table.setItem(row, 2, item)
-            item.setText(text)
-            # 顏色標示與提醒
-            default_bg = QtGui.QBrush()
-            if pct is None:
-                item.setBackground(default_bg)
-                continue
-            abs_threshold = self.alertThreshold.value()
-            triggered = abs(pct) >= abs_threshold
-            if triggered:
-                color = QtGui.QColor(220, 20, 60) if pct < 0 else QtGui.QColor(0, 128, 0)
-                item.setBackground(QtGui.QBrush(color).color())
-                self._maybe_alert(inst, pct)
-            else:
-                item.setBackground(default_bg)
-
-    def _maybe_alert(self, inst: str, pct: float):
-        if not self.alertEnable.isChecked():
-            return
-        now = datetime.datetime.now()
-        last_at = self._lastAlertAt.get(inst)
-        if last_at and (now - last_at) < datetime.timedelta(minutes=self._alertCooldownMinutes):
-            return
-        self._lastAlertAt[inst] = now
-        try:
-            QtWidgets.QMessageBox.information(
-                self,
-                "Price Alert",
-                f"{inst} 30-minute change reached {pct:+.2f}%"
-            )
-        except Exception:
-            pass
-
-    # 已移除：持倉查詢執行緒
-
-    def on_results(self, results: Dict[str, Optional[str]]):
-        for row, inst in enumerate(self.inst_ids):
-            price = results.get(inst)
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(price if price is not None else "N/A"))
-            # 更新歷史
-            try:
-                if price is not None:
-                    now = datetime.datetime.now()
-                    self.histories.setdefault(inst, []).append((now, float(price)))
-                    if len(self.histories[inst]) > 200:
-                        self.histories[inst] = self.histories[inst][-200:]
-            except Exception:
-                pass
-        self.statusLabel.setText("Complete")
-        self.refreshBtn.setEnabled(True)
-        self.update_change_column()
-        self.draw_plot()
-
-    def on_failed(self, err: str):
-        self.statusLabel.setText(f"Error: {err}")
-        self.refreshBtn.setEnabled(True)
-
-    # ===== 新增：持倉回調，更新 UPL 與 UPL Ratio 欄位 =====
-    def on_positions(self, by_inst: Dict[str, dict]):
-        # 嘗試用表中顯示的交易對去對應返回的 instId（SWAP 產品為三段）
-        inst_map: Dict[str, tuple] = {}
-        for row, inst in enumerate(self.inst_ids):
-            # 優先匹配完全相同的鍵
-            if inst in by_inst:
-                inst_map[inst] = (row, inst)
-                continue
-            # 退而求其次：BTC-USDT 對 BTC-USDT-SWAP / FUTURES 進行模糊匹配
-            for key in by_inst.keys():
-                if key.startswith(inst + "-"):
-                    inst_map[inst] = (row, key)
-                    break
-
-        for inst, (row, key) in inst_map.items():
-            pos = by_inst.get(key, {})
-            upl = pos.get("upl")
-            uplRatio = pos.get("uplRatio")
-            try:
-                upl_text = f"{float(upl):.4f}" if upl is not None else "N/A"
-            except Exception:
-                upl_text = "N/A"
-            try:
-                ratio_text = f"{float(uplRatio)*100:.2f}%" if uplRatio is not None else "N/A"
-            except Exception:
-                ratio_text = "N/A"
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(upl_text))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(ratio_text))
-
-    def on_positions_failed(self, err: str):
-        # 無權限或未設置金鑰時，將 UPL 欄位標記為 N/A
-        for row, _ in enumerate(self.inst_ids):
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem("N/A"))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem("N/A"))
-
-    def draw_plot(self):
-        if not self.inst_ids:
-            return
-        symbol = self.symbolSelect.currentText() if self.symbolSelect.count() else None
-        if not symbol:
-            return
-        
-        period = self.periodSelect.currentText()
-        
-        # 清除當前圖形
-        self.figure.clear()
-        
-        # 獲取K線數據
-        df = get_candlestick_data(symbol, period, 100)
-        
-        if df is not None and not df.empty:
-            # 使用mplfinance繪製K線圖
-            try:
-                # 使用mplfinance繪製K線圖到當前figure
-                mpf.plot(df, type='candle', style='charles', 
-                        title=f"{symbol} - {period} Candlestick Chart ({TIMEZONE})",
-                        ylabel="Price (USDT)",
-                        volume=True,
-                        figsize=(6, 4),
-                        fig=self.figure,
-                        datetime_format='%H:%M',
-                        tight_layout=True)
-                
-            except Exception as e:
-                # 如果mplfinance失敗，回退到簡單折線圖
-                ax = self.figure.add_subplot(111)
-                ax.grid(True, linestyle=":", linewidth=0.5)
-                ax.set_xlabel("Time")
-                ax.set_ylabel("Price")
-                ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-                
-                if 'close' in df.columns:
-                    ax.plot(df.index, df['close'], linewidth=1.2, color='blue')
-                    ax.set_title(f"{symbol} - {period} (Close Price)")
-                else:
-                    ax.set_title(f"{symbol} - {period} No Data")
-                
-                # 為折線圖也添加布局調整
-                self.figure.tight_layout(pad=2.0)
-        else:
-            # 沒有數據時顯示提示
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, f"{symbol} - {period}\nNo K-line Data", 
-                   ha='center', va='center', transform=ax.transAxes, fontsize=12)
-            ax.set_title(f"{symbol} - {period} No Data")
-        
-        # 調整圖形布局，確保x軸標題不被覆蓋
-        self.figure.tight_layout(pad=3.0)
-        self.figure.subplots_adjust(bottom=0.15)  # 為x軸標題留出更多空間
-        self.figure.autofmt_xdate()
-        self.canvas.draw_idle()
-
-    def update_change_column(self):
-        # 針對每個標的，計算相對 30 分鐘前的漲幅百分比
-        if not self.inst_ids:
-            return
-        now = datetime.datetime.now()
-        threshold = now - datetime.timedelta(minutes=30)
-        for row, inst in enumerate(self.inst_ids):
-            series = self.histories.get(inst, [])
-            if not series or len(series) < 2:
-                self.table.setItem(row, 2, QtWidgets.QTableWidgetItem("N/A"))
-                continue
-            # 取得當前價
-            _, current_val = series[-1]
-            # 尋找最接近且不晚於 threshold 的舊資料
-            baseline_val = None
-            last_before_or_at = None
-            for t, v in series:
-                if t <= threshold:
-                    last_before_or_at = v
-                else:
-                    break
-            if last_before_or_at is not None:
-                baseline_val = last_before_or_at
-            else:
-                # 若沒有早於閾值的資料，則以最早一筆作為基準（資料不足 30 分鐘）
-                baseline_val = series[0][1]
-            try:
-                pct = None
-                if baseline_val and baseline_val > 0:
-                    pct = (current_val - baseline_val) / baseline_val * 100.0
-                    text = f"{pct:+.2f}%"
-                else:
-                    text = "N/A"
-            except Exception:
-                text = "N/A"
-                pct = None
-            item = self.table.item(row, 2)
-            if item is None:
-                item = QtWidgets.QTableWidgetItem()
-                self.table.setItem(row, 2, item)
-            item.setText(text)
-            # 顏色標示與提醒
-            default_bg = QtGui.QBrush()
-            if pct is None:
-                item.setBackground(default_bg)
-                continue
-            abs_threshold = self.alertThreshold.value()
-            triggered = abs(pct) >= abs_threshold
-            if triggered:
-                color = QtGui.QColor(220, 20, 60) if pct < 0 else QtGui.QColor(0, 128, 0)
-                item.setBackground(QtGui.QBrush(color).color())
-                self._maybe_alert(inst, pct)
-            else:
-                item.setBackground(default_bg)
-
-    def _maybe_alert(self, inst: str, pct: float):
-        if not self.alertEnable.isChecked():
-            return
-        now = datetime.datetime.now()
-        last_at = self._lastAlertAt.get(inst)
-        if last_at and (now - last_at) < datetime.timedelta(minutes=self._alertCooldownMinutes):
-            return
-        self._lastAlertAt[inst] = now
-        try:
-            QtWidgets.QMessageBox.information(
-                self,
-                "Price Alert",
-                f"{inst} 30-minute change reached {pct:+.2f}%"
-            )
-        except Exception:
-            pass
-
-
@@ -1,17 +1,35 @@
+import functools
 import os
-from typing import Any
+import re
+from typing import Any, Iterable, List, Tuple, Union
 
+# OKX instId 格式：以 - 分隔的大寫英數段落，如 BTC-USDT、BTC-USDT-SWAP、BTC-USD-250328
+_INST_ID_RE = re.compile(r"[A-Z0-9]+(?:-[A-Z0-9]+)+")
 
-def read_item_file(file_path: str) -> Any:
-    items = []
-    if not os.path.exists(file_path):
-        return items
+
+@functools.lru_cache(maxsize=4)
+def _parse_item_file(file_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    # mtime_ns 只作為快取鍵：檔案修改後鍵值改變才會重新解析
+    # 一次讀入整個檔案再切行，略過空行與 # 註解行
     with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            raw = line.strip()
-            if not raw or raw.startswith("#"):
-                continue
-            items.append(raw)
-    return items
+        lines = f.read().splitlines()
+    return tuple(s for s in (ln.strip() for ln in lines) if s and not s.startswith("#"))
+
+
+def read_item_file(file_path: Union[str, "os.PathLike[str]"]) -> Any:
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return []
+    # 回傳副本，呼叫端修改清單不會影響快取內容
+    return list(_parse_item_file(os.fspath(file_path), mtime_ns))
+
+
+def normalize_inst_ids(inst_ids: Iterable[str]) -> List[str]:
+    """
+    去除空白並轉大寫，依原順序去重，並丟棄不符合 instId 格式的項目
+    """
+    cleaned = (s.strip().upper() for s in inst_ids if s)
+    return list(dict.fromkeys(s for s in cleaned if _INST_ID_RE.fullmatch(s)))
 
 
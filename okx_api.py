@@ -1,17 +1,77 @@
-import datetime
 import hmac
+import atexit
 import base64
 import hashlib
 import json
+import random
+import threading
+import time
 from typing import Optional, Dict, Any
+from urllib.parse import urlencode
 
 import requests
+try:
+    # 選用相依：有安裝 orjson 時以其解析回應，速度較標準 json 快數倍
+    import orjson
+except ImportError:
+    orjson = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config import OKX_BASE_URL, OKX_API_KEY, OKX_SECRET_KEY, OKX_PASSPHRASE, USE_SIMULATED_TRADING
+import config
+from config import (
+    OKX_BASE_URL, OKX_POOL_CONNECTIONS, OKX_POOL_MAXSIZE, OKX_TICKER_TTL_SECONDS,
+    OKX_MAX_CONCURRENCY, OKX_MAX_RETRIES, OKX_CANDLE_TTL_SECONDS,
+)
+from cache import FileCache, TTLCache
+
+# 全行程同時進行中的請求上限（各執行緒池共用）
+_REQUEST_SLOTS = threading.BoundedSemaphore(OKX_MAX_CONCURRENCY)
+
+_CLIENT: Optional[requests.Session] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def client() -> requests.Session:
+    """
+    取得全行程共用的 Session（首次呼叫時建立）
+    CLI、GUI 與背景執行緒共用同一連線池，重用 TCP/TLS 連線，避免每次請求重新握手
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                session = requests.Session()
+                session.headers["Connection"] = "keep-alive"
+                # 連線池至少容納所有同時進行中的請求，否則多出的連線用完即被丟棄、下次需重新握手
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=OKX_POOL_CONNECTIONS,
+                    pool_maxsize=max(OKX_POOL_MAXSIZE, OKX_MAX_CONCURRENCY),
+                    # 連線錯誤與暫時性 5xx 自動重試；429 由 http_get 自行退避處理
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=(500, 502, 503, 504),
+                        raise_on_status=False,
+                    ),
+                ))
+                atexit.register(session.close)
+                _CLIENT = session
+    return _CLIENT
+
+
+# OKX 頻率限制錯誤碼：50011 請求過於頻繁
+_RATE_LIMIT_CODES = {"50011"}
 
 
 def iso_timestamp_ms() -> str:
-    return datetime.datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+    # 直接由整數時間戳格式化 UTC ISO8601（毫秒），不建立 datetime 物件
+    sec, ms = divmod(time.time_ns() // 1_000_000, 1000)
+    tm = time.gmtime(sec)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{ms:03d}Z"
+    )
 
 
 def sign_okx(timestamp: str, method: str, request_path: str, body: str, secret_key: str) -> str:
@@ -34,52 +94,165 @@ def build_headers(api_key: str, passphrase: str, sign: Optional[str], timestamp:
     return headers
 
 
-def http_get(path: str, params: Optional[Dict[str, Any]] = None, auth: bool = False) -> Dict[str, Any]:
-    url = OKX_BASE_URL + path
+def _send_get(path: str, params: Optional[Dict[str, Any]], auth: bool) -> requests.Response:
     if not auth:
-        resp = requests.get(url, params=params, timeout=5)
-    else:
-        ts = iso_timestamp_ms()
-        query = ""
-        if params:
-            query = "?" + "&".join([f"{k}={v}" for k, v in params.items()])
-        request_path = f"{path}{query}"
-        sign = sign_okx(ts, "GET", request_path, "", OKX_SECRET_KEY)
-        headers = build_headers(OKX_API_KEY, OKX_PASSPHRASE, sign, ts, USE_SIMULATED_TRADING)
-        resp = requests.get(OKX_BASE_URL + request_path, headers=headers, timeout=5)
-
-    resp.raise_for_status()
-    data = resp.json()
-    code = data.get("code")
-    if code != "0":
-        # 直接拋出包含錯誤碼的例外，GUI 端可辨識 50011/50013/50113 等認證/權限錯誤
-        raise RuntimeError(f"OKX API error: code={code} msg={data.get('msg')}")
-    return data
+        return client().get(OKX_BASE_URL + path, params=params, timeout=5)
+    ts = iso_timestamp_ms()
+    # 簽名字串與實際送出的 URL 必須完全一致，因此自行編碼查詢參數，不交給 requests 處理
+    request_path = path + ("?" + urlencode(params) if params else "")
+    # 金鑰透過 config 模組屬性延遲讀取（首次存取才載入 .env）
+    sign = sign_okx(ts, "GET", request_path, "", config.OKX_SECRET_KEY)
+    headers = build_headers(config.OKX_API_KEY, config.OKX_PASSPHRASE, sign, ts, config.USE_SIMULATED_TRADING)
+    return client().get(OKX_BASE_URL + request_path, headers=headers, timeout=5)
+
+
+def _backoff_delay(attempt: int) -> float:
+    # 指數退避加隨機抖動，避免多個執行緒同時重試
+    return 2 ** attempt * 0.1 + random.random() * 0.1
+
+
+def http_get(path: str, params: Optional[Dict[str, Any]] = None, auth: bool = False) -> Dict[str, Any]:
+    attempt = 0
+    while True:
+        with _REQUEST_SLOTS:
+            resp = _send_get(path, params, auth)
+        # 觸發頻率限制時退避後重試，而非直接視為查無資料
+        if resp.status_code == 429 and attempt < OKX_MAX_RETRIES:
+            time.sleep(_backoff_delay(attempt))
+            attempt += 1
+            continue
+        resp.raise_for_status()
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
+        code = data.get("code")
+        if code in _RATE_LIMIT_CODES and attempt < OKX_MAX_RETRIES:
+            time.sleep(_backoff_delay(attempt))
+            attempt += 1
+            continue
+        if code != "0":
+            # 直接拋出包含錯誤碼的例外，GUI 端可辨識 50011/50013/50113 等認證/權限錯誤
+            raise RuntimeError(f"OKX API error: code={code} msg={data.get('msg')}")
+        return data
+
+
+_TICKER_CACHE = FileCache("ticker")
+# 行程內共用：GUI/CLI/背景執行緒同時查詢同一交易對時只送出一次請求
+_TICKER_MEMO = TTLCache(ttl=OKX_TICKER_TTL_SECONDS)
 
 
 def get_ticker(inst_id: str) -> Dict[str, Any]:
+    return _TICKER_MEMO.get_or_fetch(inst_id, lambda: _fetch_ticker(inst_id))
+
+
+def get_last_price(inst_id: str) -> Optional[str]:
+    """
+    只取最新成交價 last（字串）；查無資料時回傳 None
+    """
+    rows = get_ticker(inst_id).get("data")
+    return rows[0].get("last") if rows else None
+
+
+def _fetch_ticker(inst_id: str) -> Dict[str, Any]:
+    # 短時間內重複查詢同一交易對時直接使用快取（跨 CLI 執行亦有效）
+    cached = _TICKER_CACHE.get(inst_id, OKX_TICKER_TTL_SECONDS)
+    if cached is not None:
+        return cached
     path = "/api/v5/market/ticker"
     params = {"instId": inst_id}
+    data = http_get(path, params=params, auth=False)
+    _TICKER_CACHE.set(inst_id, data)
+    return data
+
+
+# 批次行情同樣短時間共用：計時刷新與手動刷新重疊時只送出一次請求
+_ALL_TICKERS_MEMO = TTLCache(ttl=OKX_TICKER_TTL_SECONDS, maxsize=8)
+
+
+def get_all_tickers(inst_type: str = "SPOT") -> Dict[str, Any]:
+    """
+    一次取得指定產品類型的全部行情
+    Args:
+        inst_type: 產品類型，可選值: SPOT, SWAP, FUTURES, OPTION
+    """
+    return _ALL_TICKERS_MEMO.get_or_fetch(inst_type, lambda: _fetch_all_tickers(inst_type))
+
+
+def _fetch_all_tickers(inst_type: str) -> Dict[str, Any]:
+    path = "/api/v5/market/tickers"
+    params = {"instType": inst_type}
     return http_get(path, params=params, auth=False)
 
 
-def get_candlesticks(inst_id: str, bar: str = "1m", limit: int = 100) -> Dict[str, Any]:
+_CANDLE_CACHE = FileCache("candles")
+# K線週期對應秒數，用於決定快取有效時間
+_BAR_SECONDS = {
+    "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
+    "1H": 3600, "2H": 7200, "4H": 14400, "6H": 21600, "12H": 43200,
+    "1D": 86400, "1W": 604800, "1M": 2592000, "3M": 7776000,
+}
+
+
+def _candle_ttl(bar: str) -> float:
+    # 快取時間不超過一根K線的長度，也不超過設定上限
+    return min(_BAR_SECONDS.get(bar, 60), OKX_CANDLE_TTL_SECONDS)
+
+
+def get_candlesticks(
+    inst_id: str,
+    bar: str = "1m",
+    limit: int = 100,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    獲取K線數據
+    獲取K線數據（由新到舊排序）
     Args:
         inst_id: 交易對ID，如 "BTC-USDT"
         bar: K線週期，可選值: 1m, 3m, 5m, 15m, 30m, 1H, 2H, 4H, 6H, 12H, 1D, 1W, 1M, 3M
         limit: 返回數據條數，最大100
+        after: 分頁，返回此時間戳（毫秒）之前的較舊數據
+        before: 分頁，返回此時間戳（毫秒）之後的較新數據
     """
+    if after or before:
+        # 分頁查詢直接送出，不經快取
+        return _fetch_candlesticks(inst_id, bar, limit, after=after, before=before)
+    # 週期區分大小寫（1m/1M），以雜湊作為快取檔名避免不分大小寫的檔案系統衝突
+    key = hashlib.md5(f"{inst_id}|{bar}|{limit}".encode("utf-8")).hexdigest()
+    cached = _CANDLE_CACHE.get(key, _candle_ttl(bar))
+    if cached is not None:
+        return cached
+    data = _refresh_candlesticks(inst_id, bar, limit, _CANDLE_CACHE.get(key, float("inf")))
+    _CANDLE_CACHE.set(key, data)
+    return data
+
+
+def _fetch_candlesticks(inst_id: str, bar: str, limit: int, **cursor: Optional[str]) -> Dict[str, Any]:
     path = "/api/v5/market/candles"
     params = {
         "instId": inst_id,
         "bar": bar,
         "limit": str(limit)
     }
+    params.update({k: v for k, v in cursor.items() if v})
     return http_get(path, params=params, auth=False)
 
 
+def _refresh_candlesticks(inst_id: str, bar: str, limit: int, stale: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    快取過期時只補抓最後一根已收盤K線之後的數據，再與舊數據合併
+    已收盤的K線不會再變動；未收盤（confirm != "1"）的那根一律重新取得
+    """
+    confirmed = [row for row in (stale or {}).get("data") or [] if len(row) > 8 and row[8] == "1"]
+    if confirmed:
+        fresh = _fetch_candlesticks(inst_id, bar, limit, before=confirmed[0][0])
+        new_rows = fresh.get("data") or []
+        # 新數據達 limit 筆表示可能與舊數據之間有缺口，改為完整重抓
+        if len(new_rows) < limit:
+            merged = dict(fresh)
+            merged["data"] = (new_rows + confirmed)[:limit]
+            return merged
+    return _fetch_candlesticks(inst_id, bar, limit)
+
+
 # ===== 資產 / 帳戶 私有端點 =====
 def get_account_balance(ccy: Optional[str] = None) -> Dict[str, Any]:
     """
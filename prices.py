@@ -0,0 +1,105 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Optional, Dict, Iterator, List, Tuple
+
+from items import normalize_inst_ids
+from okx_api import get_last_price, get_all_tickers
+from config import OKX_MAX_WORKERS
+
+# 交易對數量達此門檻時改用批次行情端點（一次請求取回全部現貨行情）
+BULK_TICKERS_MIN_ITEMS = 3
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    # 共用的執行緒池：GUI 每次刷新重用既有執行緒，不必每次重新建立
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=max(1, OKX_MAX_WORKERS), thread_name_prefix="okx-ticker")
+    return _EXECUTOR
+
+
+def _iter_prices_each(inst_ids: Any) -> Iterator[Tuple[str, Optional[str]]]:
+    # 行情查詢為 I/O 密集，以執行緒池併發送出請求，依完成順序逐筆產出
+    ex = _executor()
+    futures = {ex.submit(get_last_price, inst_id): inst_id for inst_id in inst_ids}
+    for fut in as_completed(futures):
+        try:
+            last = fut.result()
+        except Exception:
+            last = None
+        yield futures[fut], last
+
+
+# 可使用批次行情端點的產品類型；OPTION 需額外指定 instFamily，改逐一查詢
+_BULK_INST_TYPES = ("SPOT", "SWAP", "FUTURES")
+
+
+def _guess_inst_type(inst_id: str) -> Optional[str]:
+    # 依交易對格式推斷產品類型：BTC-USDT / BTC-USDT-SWAP / BTC-USD-250328
+    parts = inst_id.split("-")
+    if len(parts) == 2:
+        return "SPOT"
+    if len(parts) == 3:
+        if parts[2] == "SWAP":
+            return "SWAP"
+        if parts[2].isdigit():
+            return "FUTURES"
+    return None
+
+
+def _iter_prices_bulk(inst_ids: Any) -> Iterator[Tuple[str, Optional[str]]]:
+    # 依產品類型分組，每種類型只送一次批次請求
+    groups: Dict[str, List[str]] = {}
+    missing = []
+    for inst_id in inst_ids:
+        inst_type = _guess_inst_type(inst_id)
+        if inst_type in _BULK_INST_TYPES:
+            groups.setdefault(inst_type, []).append(inst_id)
+        else:
+            missing.append(inst_id)
+    for inst_type, group in groups.items():
+        try:
+            data = get_all_tickers(inst_type)
+            by_id = {row.get("instId"): row.get("last") for row in data.get("data") or []}
+        except Exception:
+            # 批次請求本身失敗時不逐一重查，避免端點異常時放大請求量
+            for inst_id in group:
+                yield inst_id, None
+            continue
+        for inst_id in group:
+            if inst_id in by_id:
+                yield inst_id, by_id[inst_id]
+            else:
+                missing.append(inst_id)
+    # 批次回應中沒有或無法批次查詢的交易對改為逐一查詢
+    if missing:
+        yield from _iter_prices_each(missing)
+
+
+def iter_prices_for_items(inst_ids: Any, bulk: Optional[bool] = None) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    逐筆產出 (inst_id, last)，查詢失敗或查無資料時 last 為 None
+    Args:
+        bulk: True 一律使用批次行情端點、False 一律逐一查詢、None 依數量自動選擇
+    """
+    # 重複或格式錯誤的交易對不送出請求
+    inst_ids = normalize_inst_ids(inst_ids)
+    if not inst_ids:
+        return
+    if bulk is None:
+        # 少量交易對時批次回應過大，逐一查詢較划算
+        bulk = len(inst_ids) >= BULK_TICKERS_MIN_ITEMS
+    if bulk:
+        yield from _iter_prices_bulk(inst_ids)
+    else:
+        yield from _iter_prices_each(inst_ids)
+
+
+def get_prices_for_items(inst_ids: Any, bulk: Optional[bool] = None) -> Dict[str, Optional[str]]:
+    return dict(iter_prices_for_items(inst_ids, bulk))